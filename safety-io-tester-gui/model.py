@@ -12,6 +12,7 @@ import serial
 from serial import SerialException, SerialTimeoutException
 import serial.tools.list_ports
 import logging
+import threading
 from mock_serial_port import MockSerialPort
 from time import sleep
 
@@ -27,6 +28,7 @@ class Model:
 
     Attributes:
         serial: Serial object for serial communication
+        serial_lock: Lock held for each request/response exchange with the device
         output_pin_states: Dictionary of dual channel pin names to a tuple of pin states
 
     Methods:
@@ -56,6 +58,10 @@ class Model:
         self.serial.timeout = 1  # Timeout for read operations (in seconds)
         self.serial.write_timeout = 1  # Timeout for write operations (in seconds)
 
+        # The GUI and the output pin polling thread share the serial port, so each
+        # request and its response must not be interleaved with another exchange
+        self.serial_lock = threading.RLock()
+
         self.output_pin_states = {
             "mode1": (False, False),
             "mode2": (False, False),
@@ -103,7 +109,8 @@ class Model:
         """
         Disconnect from the serial device
         """
-        self.serial.close()
+        with self.serial_lock:
+            self.serial.close()
 
     def write_data(self, data: bytes) -> bool:
         """
@@ -114,18 +121,19 @@ class Model:
         Returns:
             True if the data was sent successfully, False otherwise
         """
-        try:
-            self.serial.write(data)
-            logger.info(f"Sent data: '{data.decode().strip()}'")
-            if self.read_response_OK():
-                return True
-            logger.warning("Did not recieve 'OK' response from Safety IO Tester")
-            self.disconnect_from_serial_port()
-            return False
-
-        except (SerialException, SerialTimeoutException):
-            self.disconnect_from_serial_port()
-            return False
+        with self.serial_lock:
+            try:
+                self.serial.write(data)
+                logger.info(f"Sent data: '{data.decode().strip()}'")
+                if self.read_response_OK():
+                    return True
+                logger.warning("Did not recieve 'OK' response from Safety IO Tester")
+                self.disconnect_from_serial_port()
+                return False
+
+            except (SerialException, SerialTimeoutException):
+                self.disconnect_from_serial_port()
+                return False
 
     def read_response_OK(self) -> bool:
         """
@@ -138,7 +146,6 @@ class Model:
             SerialException: if there is an error reading from the serial device
         """
         response = self.serial.readline().decode().strip()
-        # logger.debug(f"Response: '{response}'")
         return response == "OK"
 
     def request_output_pin_states(self) -> dict[str, tuple[bool, bool]]:
@@ -180,21 +187,21 @@ class Model:
             Dictionary of dual channel pin names to a tuple of pin states (A, B)
             or an empty dictionary if there was an error
         """
-        try:
-            # Send request and get response
-            self.serial.write(b"R\n")
-            response = self.serial.readline().decode().strip()
+        with self.serial_lock:
+            try:
+                # Send request and get response
+                self.serial.write(b"R\n")
+                response = self.serial.readline().decode().strip()
 
-        except (SerialException, SerialTimeoutException):
-            self.disconnect_from_serial_port()
-            return {}
+            except (SerialException, SerialTimeoutException):
+                self.disconnect_from_serial_port()
+                return {}
 
-        # Invalid response syntax
-        if response[0] != "A" or response[9] != "B" or len(response) != 18:
+        # Invalid response syntax (check the length first, a timeout returns "")
+        if len(response) != 18 or response[0] != "A" or response[9] != "B":
             return {}
 
         # Parse response
-        # logger.debug(f"Response: '{response}'")
         pin_states = {
             "mode1": (response[1] == "1", response[10] == "1"),
             "mode2": (response[2] == "1", response[11] == "1"),
@@ -484,17 +491,19 @@ class Model:
             or None if the request failed
         """
         heartbeat_hz = None
-        try:
-            self.serial.write(b"H\n")
-            logger.info(f"Sent data: 'H'")
-            # Wait for serial device to measure heartbeat
-            sleep(1)
-            data = self.serial.readline().decode().strip()
-            logger.info(f"Response: '{data}'")
-        except SerialException:
-            return None
+        with self.serial_lock:
+            try:
+                self.serial.write(b"H\n")
+                logger.info(f"Sent data: 'H'")
+                # Wait for serial device to measure heartbeat
+                sleep(1)
+                data = self.serial.readline().decode().strip()
+                logger.info(f"Response: '{data}'")
+            except SerialException:
+                return None
 
-        if data[0] == "A" and data[6] == "B" and len(data) == 12:
+        # Check the length first, a timeout returns ""
+        if len(data) == 12 and data[0] == "A" and data[6] == "B":
             try:
                 heartbeat_hz = (int(data[1:6]), int(data[7:12]))
             except ValueError:
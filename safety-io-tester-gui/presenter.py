@@ -12,10 +12,13 @@ decoupling between the two.
 
 from __future__ import annotations
 from typing import Protocol
-from model import Model
+from functools import partial, wraps
 import logging
+import queue
+import threading
 
-POLLING_RATE = 100  # Polling rate for output pin states [ms]
+POLLING_RATE_MIN = 50  # Polling interval for output pin states after a change [ms]
+POLLING_RATE_MAX = 500  # Polling interval while output pin states are unchanged [ms]
 logger = logging.getLogger("safety_io_logger")  # Logger for all modules
 
 
@@ -84,13 +87,30 @@ class View(Protocol):
     def log(self, message: str) -> None:
         ...
 
-    def after(self, ms: int, func: callable) -> None:
+    def schedule_ui(self, func: callable, *args) -> None:
         ...
 
     def mainloop(self) -> None:
         ...
 
 
+def io_request(method: callable) -> callable:
+    """
+    Decorator for Presenter methods that communicate with the serial device
+
+    Calling the decorated method queues it to run on the I/O thread and returns
+    immediately, so serial I/O never blocks the GUI thread. Requests run one at
+    a time in the order they were made. The method must only touch the view
+    through view.schedule_ui
+    """
+
+    @wraps(method)
+    def queue_request(self: Presenter, *args, **kwargs) -> None:
+        self.io_queue.put(partial(method, self, *args, **kwargs))
+
+    return queue_request
+
+
 class Presenter:
 
     """
@@ -99,10 +119,17 @@ class Presenter:
     Attributes:
         model: Model object
         view: View object
+        io_queue: Queue of requests to run on the I/O thread
+        stop_polling: Event set to stop the current polling thread
+        poll_now: Event set to wake the current polling thread for an immediate poll
 
     Methods:
         run: Run the application
-        update_output_pin_indicators: Update the output pin indicators in the GUI
+        process_io_requests: Run queued I/O requests on the I/O thread
+        start_polling_output_pins: Start polling the output pins in the background
+        poll_output_pin_states: Poll the output pins until polling is stopped
+        poll_output_pins: Poll the output pins as soon as possible
+        stop_polling_output_pins: Stop polling the output pins
         connect_to_serial_port: Connect to the serial port
         disconnect_from_serial_port: Disconnect from the serial port
         failed_to_communicate: Log failed communication and disconnect from serial port
@@ -125,6 +152,10 @@ class Presenter:
         self.model = model
         self.view = view
 
+        self.io_queue = queue.Queue()
+        self.stop_polling = threading.Event()
+        self.poll_now = threading.Event()
+
     def run(self) -> None:
         """
         Run the application
@@ -135,24 +166,100 @@ class Presenter:
         # Start logging
         self.start_logger()
 
+        # Start handling serial I/O requests
+        threading.Thread(target=self.process_io_requests, daemon=True).start()
+
         # Start GUI
         self.view.mainloop()
 
-    def update_output_pin_indicators(self) -> None:
+    def process_io_requests(self) -> None:
         """
-        Update the output pin indicators in the GUI
+        Run queued I/O requests in order
 
-        This function is called every POLLING_RATE ms
+        Runs on the I/O thread for the lifetime of the application
         """
-        pin_states = self.model.request_output_pin_states()
-        if not pin_states:
-            self.failed_to_communicate()
-            return
-        self.view.set_output_pin_indicators(pin_states)
+        while True:
+            request = self.io_queue.get()
+            try:
+                request()
+            except Exception:
+                logger.exception("Unexpected error while handling an I/O request")
 
-        # Poll again after POLLING_RATE ms
-        self.view.after(POLLING_RATE, self.update_output_pin_indicators)
+    def start_polling_output_pins(self) -> None:
+        """
+        Start polling the output pin states on a background thread
+
+        Serial I/O for polling never blocks the GUI thread. Changed states are
+        handed to the GUI thread with view.schedule_ui. Safe to call from any
+        thread
+        """
+        self.stop_polling_output_pins()
+
+        # Give each polling thread its own events so that a thread left over
+        # from a previous connection cannot affect this one
+        self.stop_polling = threading.Event()
+        self.poll_now = threading.Event()
+        threading.Thread(
+            target=self.poll_output_pin_states,
+            args=(self.stop_polling, self.poll_now),
+            daemon=True,
+        ).start()
+
+    def poll_output_pin_states(
+        self, stop_polling: threading.Event, poll_now: threading.Event
+    ) -> None:
+        """
+        Poll the output pin states until stop_polling is set
+
+        Runs on the polling thread. Only changed pin states are sent to the GUI,
+        and the serial port is disconnected if communication fails. The polling
+        interval drops to POLLING_RATE_MIN ms after a change and doubles on each
+        unchanged poll, up to POLLING_RATE_MAX ms
+
+        stop_polling: event set to stop polling
+        poll_now: event set to wake this thread for an immediate poll
+        """
+        pin_states = {}
+        polling_rate = POLLING_RATE_MIN
 
+        while True:
+            poll_now.wait(polling_rate / 1000)
+            poll_now.clear()
+            if stop_polling.is_set():
+                return
+
+            new_pin_states = self.model.request_output_pin_states()
+
+            # Disconnected while the request was in progress
+            if stop_polling.is_set():
+                return
+
+            if not new_pin_states:
+                self.io_queue.put(self.failed_to_communicate)
+                return
+
+            if new_pin_states != pin_states:
+                pin_states = new_pin_states
+                self.view.schedule_ui(self.view.set_output_pin_indicators, pin_states)
+                polling_rate = POLLING_RATE_MIN
+            else:
+                polling_rate = min(polling_rate * 2, POLLING_RATE_MAX)
+
+    def poll_output_pins(self) -> None:
+        """
+        Poll the output pins as soon as possible, e.g. after a command that changes
+        their state
+        """
+        self.poll_now.set()
+
+    def stop_polling_output_pins(self) -> None:
+        """
+        Stop the polling thread. Safe to call from any thread
+        """
+        self.stop_polling.set()
+        self.poll_now.set()
+
+    @io_request
     def connect_to_serial_port(self, port: str) -> None:
         """
         Connect to the serial port
@@ -176,30 +283,36 @@ class Presenter:
         # Attempt to connect to serial port
         if self.model.connect_to_serial_port(port):
             logger.info(f"Successfully connected to serial port '{port}'")
-            self.view.set_connection_status("Connected", port=port)
+            self.view.schedule_ui(self.view.set_connection_status, "Connected", port)
 
             # Begin polling output pin states
-            self.view.after(POLLING_RATE, self.update_output_pin_indicators)
+            self.start_polling_output_pins()
         else:
             logger.error(f"Failed to connect to serial port '{port}'")
-            self.view.set_connection_status("Disconnected")
+            self.view.schedule_ui(self.view.set_connection_status, "Disconnected")
 
+    @io_request
     def disconnect_from_serial_port(self) -> None:
         """
         Disconnect from the serial port
         """
+        self.stop_polling_output_pins()
         self.model.disconnect_from_serial_port()
         logger.info("Disconnected from serial port")
-        self.view.set_connection_status("Disconnected")
+        self.view.schedule_ui(self.view.set_connection_status, "Disconnected")
 
     def failed_to_communicate(self) -> None:
         """
         Log a failed communication attempt and disconnect from the serial port
+
+        Must be called on the I/O thread
         """
         logger.error("Failed to communincate with serial device")
+        self.stop_polling_output_pins()
         self.model.disconnect_from_serial_port()
-        self.view.set_connection_status("Disconnected")
+        self.view.schedule_ui(self.view.set_connection_status, "Disconnected")
 
+    @io_request
     def set_mode(self, mode: str) -> None:
         """
         Set the mode of the controller
@@ -208,9 +321,11 @@ class Presenter:
         """
         if self.model.set_mode(mode):
             logger.debug(f"Mode set to '{mode}'")
+            self.poll_output_pins()
         else:
             self.failed_to_communicate()
 
+    @io_request
     def toggle_mode_bit(self, bit_id: str) -> None:
         """
         Toggle a single mode bit of the controller
@@ -219,9 +334,11 @@ class Presenter:
         """
         if self.model.toggle_mode_bit(bit_id):
             logger.debug(f"Mode bit '{bit_id}' toggled")
+            self.poll_output_pins()
         else:
             self.failed_to_communicate()
 
+    @io_request
     def toggle_e_stop(self, trigger_state: int, delay_ms: str) -> None:
         """
         Toggle the e-stop bits of the controller
@@ -253,9 +370,12 @@ class Presenter:
                     logger.debug(f"E-stop B only")
                     communication_successful = True
 
-        if not communication_successful:
+        if communication_successful:
+            self.poll_output_pins()
+        else:
             self.failed_to_communicate()
 
+    @io_request
     def toggle_interlock(self, trigger_state: str, delay_ms: str) -> None:
         """
         Toggle the interlock bits of the controller
@@ -287,18 +407,23 @@ class Presenter:
                     logger.debug(f"Interlock B only")
                     communication_successful = True
 
-        if not communication_successful:
+        if communication_successful:
+            self.poll_output_pins()
+        else:
             self.failed_to_communicate()
 
+    @io_request
     def toggle_power(self) -> None:
         """
         Toggle the controller power
         """
         if self.model.toggle_power():
             logger.debug(f"Power toggled")
+            self.poll_output_pins()
         else:
             self.failed_to_communicate()
 
+    @io_request
     def measure_heartbeat(self) -> None:
         """
         Measure the heartbeat (A and B) of the controller and display the results
@@ -308,10 +433,11 @@ class Presenter:
             logger.debug(
                 f"Heartbeat A: {heartbeat_hz[0]}, Heartbeat B: {heartbeat_hz[1]}"
             )
-            self.view.set_heartbeat_values(heartbeat_hz)
+            self.view.schedule_ui(self.view.set_heartbeat_values, heartbeat_hz)
         else:
             self.failed_to_communicate()
 
+    @io_request
     def echo_string(self, message: str) -> None:
         """
         Echo a string to be displayed on the Saftey IO Tester
@@ -338,10 +464,10 @@ class Presenter:
         logger.addHandler(console_handler)
 
         # Start GUI logging
-        gui_handler = Gui_Log_Handler(self.view)
-        gui_handler.setLevel(logging.INFO)
-        gui_handler.setFormatter(self.log_formatter)
-        logger.addHandler(gui_handler)
+        gui_log_handler = Gui_Log_Handler(self.view)
+        gui_log_handler.setLevel(logging.INFO)
+        gui_log_handler.setFormatter(self.log_formatter)
+        logger.addHandler(gui_log_handler)
 
     def start_logging_to_file(self, file_path: str) -> None:
         """
@@ -392,7 +518,13 @@ class Gui_Log_Handler(logging.Handler):
         """
         Emit a log message by displaying it in the GUI
 
+        Widgets may only be used from the GUI thread, so messages logged from
+        background threads are handed to the GUI thread with view.schedule_ui
+
         record: log record
         """
         msg = self.format(record)
-        self.view.log(msg)
+        if threading.current_thread() is threading.main_thread():
+            self.view.log(msg)
+        else:
+            self.view.schedule_ui(self.view.log, msg)
@@ -10,15 +10,49 @@ It contains all GUI widgets and binds user interactions to the Presenter.
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog as fd
+from functools import partial
 from typing import Protocol
-from abc import ABC, abstractmethod
-from PIL import ImageTk, Image
+import queue
 from pathlib import Path
 
 
 TITLE = "Safety I/O Tester"
 IMAGE_PATH = Path(__file__).absolute().parent / "Resource/Images/"
 FONT_SIZE = 11
+BUTTON_FONT = ("TkDefaultFont", FONT_SIZE)
+BUTTON_FONT_BOLD = ("TkDefaultFont", FONT_SIZE, "bold")
+UI_QUEUE_RATE_MIN = 20  # Check interval for background GUI updates after work [ms]
+UI_QUEUE_RATE_MAX = 100  # Check interval for background GUI updates while idle [ms]
+
+VALID_MODES = ("Automatic", "Stop", "Manual", "Mute")
+
+# Dual channel trigger selection, dropdown text by trigger state
+TRIGGER_STATES = {
+    "A and B": "Toggle A and B together",
+    "A then B": "Toggle A then B, [Delay] ms",
+    "B then A": "Toggle B then A, [Delay] ms",
+    "A only": "Toggle A only",
+    "B only": "Toggle B only",
+}
+TRIGGER_STATE_TEXTS = tuple(TRIGGER_STATES.values())
+
+# Trigger states by dropdown text, for lookups when a trigger button is clicked
+TRIGGER_STATE_KEYS = {text: key for key, text in TRIGGER_STATES.items()}
+
+# Trigger states that toggle the second channel after a delay
+DELAY_TRIGGER_STATES = {TRIGGER_STATES["A then B"], TRIGGER_STATES["B then A"]}
+
+
+def validate_delay_entry(value: str) -> bool:
+    """
+    Validate a delay entry value is an integer between 0 and 99999
+
+    str.isdigit also accepts non-ASCII digits such as superscripts, which
+    int() rejects, so the value must be ASCII as well
+
+    value: proposed value of the entry
+    """
+    return not value or (len(value) <= 5 and value.isascii() and value.isdigit())
 
 
 class Presenter(Protocol):
@@ -66,6 +100,12 @@ class View(tk.Tk):
     Attributes:
         frm_interactive: Interactive_Frame object
         frm_logging: Logging_Frame object
+        ind_off_img: Output pin indicator image shared by all panels (off state)
+        ind_on_img: Output pin indicator image shared by all panels (on state)
+        ind_background: Background color of the output pin indicator canvases
+        delay_vcmd: Validate command shared by all delay entries
+        ui_queue: Queue of GUI updates scheduled from background threads
+        ui_queue_rate: Current interval between checks of ui_queue [ms]
 
     Methods:
         init_gui: Initialize the GUI widgets and add them to the window
@@ -73,31 +113,58 @@ class View(tk.Tk):
         set_connection_status: Set the widgets to indicate the serial connection status
         set_heartbeat_values: Set the heartbeat values in the GUI
         log: Log a message to the logging frame
+        set_icon: Set the window icon, decoding the logo image only once
+        schedule_ui: Schedule a GUI update to run on the GUI thread
+        process_ui_queue: Run the GUI updates scheduled from background threads
     """
 
+    icon: tk.PhotoImage = None  # Window icon shared by all View instances
+
     def __init__(self) -> None:
         """
         Initialize the GUI configuration
         """
         super().__init__()
         self.title(TITLE)
-        self.iconphoto(False, tk.PhotoImage(file=IMAGE_PATH / "brooks_logo.png"))
         self.resizable(False, False)
 
+        # Decode the logo once the event loop goes idle, after startup work
+        self.after_idle(self.set_icon)
+
         # Set font size for all widgets
         style = ttk.Style(self)
         style.configure(".", font=("TkDefaultFont", FONT_SIZE))
         self.option_add("*Font", ("TkDefaultFont", FONT_SIZE))
 
+        # Indicator canvases blend in with the themed frames around them
+        self.ind_background = style.lookup("TFrame", "background")
+
         # Default button size for consistency
         self.button_size = (15, 1)
 
+        # Register the delay entry validator once for all panels
+        self.delay_vcmd = (self.register(validate_delay_entry), "%P")
+
+        # Widgets may only be used from the GUI thread, so background threads
+        # hand their GUI updates over through this queue
+        self.ui_queue = queue.SimpleQueue()
+        self.ui_queue_rate = UI_QUEUE_RATE_MAX
+        self.after(self.ui_queue_rate, self.process_ui_queue)
+
     def init_gui(self, presenter: Presenter) -> None:
         """
         Initialize the GUI widgets and add them to the window
 
         presenter: Presenter object
         """
+        # Decode the output pin indicator images once for all panels
+        self.ind_off_img = tk.PhotoImage(
+            master=self, file=IMAGE_PATH / "indicator_off.png"
+        )
+        self.ind_on_img = tk.PhotoImage(
+            master=self, file=IMAGE_PATH / "indicator_on.png"
+        )
+
         self.frm_interactive = Interactive_Frame(self, presenter)
         self.frm_logging = Logging_Frame(self, presenter)
 
@@ -137,6 +204,44 @@ class View(tk.Tk):
         """
         self.frm_logging.log_to_text_box(message)
 
+    def set_icon(self) -> None:
+        """
+        Set the window icon
+
+        The logo is decoded on first use and reused by later windows that share
+        the same Tk interpreter
+        """
+        if View.icon is None or View.icon.tk is not self.tk:
+            View.icon = tk.PhotoImage(master=self, file=IMAGE_PATH / "brooks_logo.png")
+        self.iconphoto(False, View.icon)
+
+    def schedule_ui(self, func: callable, *args) -> None:
+        """
+        Schedule a GUI update to run on the GUI thread. Safe to call from any thread
+
+        func: function to call on the GUI thread
+        args: arguments to pass to func
+        """
+        self.ui_queue.put(partial(func, *args))
+
+    def process_ui_queue(self) -> None:
+        """
+        Run the GUI updates scheduled from background threads
+
+        The check interval drops to UI_QUEUE_RATE_MIN ms after running updates
+        and doubles on each empty check, up to UI_QUEUE_RATE_MAX ms
+        """
+        if self.ui_queue.empty():
+            self.ui_queue_rate = min(self.ui_queue_rate * 2, UI_QUEUE_RATE_MAX)
+        else:
+            self.ui_queue_rate = UI_QUEUE_RATE_MIN
+
+        # Reschedule first so a failing update cannot stop the checks
+        self.after(self.ui_queue_rate, self.process_ui_queue)
+
+        while not self.ui_queue.empty():
+            self.ui_queue.get()()
+
 
 class Interactive_Frame(ttk.Frame):
 
@@ -151,6 +256,7 @@ class Interactive_Frame(ttk.Frame):
         pnl_power: Power_Panel object
         pnl_heartbeat: Heartbeat_Panel object
         pnl_echo_str: Echo_String_Panel object
+        pin_dispatch: (pin name, panel, indicator row) of each output pin pair
 
     Methods:
         create_panels: Create all interactive panels and add them to the frame
@@ -166,23 +272,51 @@ class Interactive_Frame(ttk.Frame):
         super().__init__(parent, **kwargs)
         self.presenter = presenter
         self.button_size = parent.button_size
+        self.ind_off_img = parent.ind_off_img
+        self.ind_on_img = parent.ind_on_img
+        self.ind_background = parent.ind_background
+        self.delay_vcmd = parent.delay_vcmd
         self.create_panels()
 
     def create_panels(self) -> None:
         """
         Create all interactive panels and add them to the frame
         """
-        grid_row = tk.IntVar(self, 0)
-        self.pnl_ser_con = Serial_Connect_Panel(self, self.presenter, grid_row=grid_row)
-        self.pnl_mode = Mode_Selection_Panel(self, self.presenter, grid_row=grid_row)
-        self.pnl_estop = Emergency_Stop_Panel(self, self.presenter, grid_row=grid_row)
-        self.pnl_interlock = Interlock_Panel(self, self.presenter, grid_row=grid_row)
-        self.pnl_power = Power_Panel(self, self.presenter, grid_row=grid_row)
-        self.pnl_heartbeat = Heartbeat_Panel(self, self.presenter, grid_row=grid_row)
-        self.pnl_echo_str = Echo_String_Panel(self, self.presenter, grid_row=grid_row)
+        # Next free grid row, advanced in place by each panel
+        grid_row = [0]
+        panel_classes = (
+            Serial_Connect_Panel,
+            Mode_Selection_Panel,
+            Emergency_Stop_Panel,
+            Interlock_Panel,
+            Power_Panel,
+            Heartbeat_Panel,
+            Echo_String_Panel,
+        )
+        (
+            self.pnl_ser_con,
+            self.pnl_mode,
+            self.pnl_estop,
+            self.pnl_interlock,
+            self.pnl_power,
+            self.pnl_heartbeat,
+            self.pnl_echo_str,
+        ) = [panel(self, self.presenter, grid_row) for panel in panel_classes]
+
+        # Panel and indicator row showing each output pin pair
+        self.pin_dispatch = (
+            ("mode1", self.pnl_mode, 0),
+            ("mode2", self.pnl_mode, 1),
+            ("estop", self.pnl_estop, 0),
+            ("stop", self.pnl_estop, 1),
+            ("interlock", self.pnl_interlock, 0),
+            ("power", self.pnl_power, 0),
+            ("heartbeat", self.pnl_heartbeat, 0),
+            ("teach", self.pnl_echo_str, 0),
+        )
 
         ttk.Separator(self, orient="vertical").grid(
-            row=0, column=3, rowspan=grid_row.get(), sticky="NS"
+            row=0, column=3, rowspan=grid_row[0], sticky="NS"
         )
 
     def set_output_indicators(self, pin_states: dict[str, tuple[bool, bool]]) -> None:
@@ -191,14 +325,8 @@ class Interactive_Frame(ttk.Frame):
 
         pin_states: dictionary of pin states
         """
-        self.pnl_mode.set_output_indicators(*pin_states["mode1"], grid_row=0)
-        self.pnl_mode.set_output_indicators(*pin_states["mode2"], grid_row=1)
-        self.pnl_estop.set_output_indicators(*pin_states["estop"], grid_row=0)
-        self.pnl_estop.set_output_indicators(*pin_states["stop"], grid_row=1)
-        self.pnl_interlock.set_output_indicators(*pin_states["interlock"])
-        self.pnl_power.set_output_indicators(*pin_states["power"])
-        self.pnl_heartbeat.set_output_indicators(*pin_states["heartbeat"])
-        self.pnl_echo_str.set_output_indicators(*pin_states["teach"])
+        for pin, panel, grid_row in self.pin_dispatch:
+            panel.set_output_indicators(*pin_states[pin], grid_row)
 
     def set_connection_status(self, status: str, port: str = None) -> None:
         """
@@ -218,16 +346,31 @@ class Interactive_Frame(ttk.Frame):
         self.pnl_heartbeat.set_heartbeat_values(heartbeat_hz)
 
 
-class Interactive_Panel(ABC):
+class Interactive_Panel:
 
     """
-    Abstract base class for left-center-right split interactive panels
+    Base class for left-center-right split interactive panels
 
-    Contains widgets and methods common to all such panels
+    Contains widgets and methods common to all such panels.
+    Subclasses must override create_left_widgets, create_center_widgets,
+    and create_right_widgets, which is checked when the subclass is defined.
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Check that the subclass overrides all widget creation methods
+        """
+        super().__init_subclass__(**kwargs)
+        for method in (
+            "create_left_widgets",
+            "create_center_widgets",
+            "create_right_widgets",
+        ):
+            if getattr(cls, method) is getattr(Interactive_Panel, method):
+                raise TypeError(f"{cls.__name__} must override {method}")
+
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
         Initialize the panel
@@ -239,47 +382,50 @@ class Interactive_Panel(ABC):
         pady = 10
 
         frm_left = ttk.Frame(parent)
-        frm_left.grid(row=grid_row.get(), column=0, padx=padx, pady=pady, sticky="NESW")
         frm_center = ttk.Frame(parent)
-        frm_center.grid(row=grid_row.get(), column=2, padx=padx, pady=pady, sticky="")
         frm_right = ttk.Frame(parent)
-        frm_right.grid(row=grid_row.get(), column=4, padx=padx, pady=pady, sticky="")
-        grid_row.set(grid_row.get() + 1)
-
-        ttk.Separator(parent, orient="horizontal").grid(
-            row=grid_row.get(), column=0, columnspan=5, sticky="EW"
+        separator = ttk.Separator(parent, orient="horizontal")
+
+        # Lay out the panel frames and separator with a single Tcl script
+        row = grid_row[0]
+        pad = f"-padx {padx} -pady {pady}"
+        parent.tk.eval(
+            f"grid {frm_left} -row {row} -column 0 {pad} -sticky nesw\n"
+            f"grid {frm_center} -row {row} -column 2 {pad}\n"
+            f"grid {frm_right} -row {row} -column 4 {pad}\n"
+            f"grid {separator} -row {row + 1} -column 0 -columnspan 5 -sticky ew"
         )
-        grid_row.set(grid_row.get() + 1)
+        grid_row[0] += 2
 
-        # Create output pin indicator images
-        self.output_pin_indicators = {}
-        self.ind_off_img = ImageTk.PhotoImage(
-            Image.open(IMAGE_PATH / "indicator_off.png")
-        )
-        self.ind_on_img = ImageTk.PhotoImage(
-            Image.open(IMAGE_PATH / "indicator_on.png")
-        )
+        # Indicators and the states they show, indexed by indicator row
+        self.left_indicators = []
+        self.right_indicators = []
+        self.left_states = []
+        self.right_states = []
+
+        # Output pin indicators share the images loaded by the View, indexed by
+        # pin state (False -> off, True -> on)
+        self.ind_off_img = parent.ind_off_img
+        self.ind_imgs = (parent.ind_off_img, parent.ind_on_img)
+        self.ind_background = parent.ind_background
 
         # Create widgets
         self.create_left_widgets(frm_left)
         self.create_center_widgets(frm_center)
         self.create_right_widgets(frm_right)
 
-    @abstractmethod
     def create_left_widgets(self, frame: ttk.Frame) -> None:
         """
         Create widgets on the left side of the panel
         """
         pass
 
-    @abstractmethod
     def create_center_widgets(self, frame: ttk.Frame) -> None:
         """
         Create widgets in the center of the panel
         """
         pass
 
-    @abstractmethod
     def create_right_widgets(self, frame: ttk.Frame) -> None:
         """
         Create widgets on the right side of the panel
@@ -287,37 +433,74 @@ class Interactive_Panel(ABC):
         pass
 
     def add_output_pin_pair(
-        self, frame: ttk.Frame, lbl_left: str, lbl_right: str, grid_row: int = 0
+        self, frame: ttk.Frame, lbl_left: str, lbl_right: str
     ) -> None:
         """
-        Add a pair of output pin indicators to the frame
+        Add a pair of output pin indicators to the next row of the frame
+
+        The row is the index of the pair in the indicator lists, so rows always
+        match the grid_row passed to set_output_indicators
         """
+        grid_row = len(self.left_indicators)
+
         lbl_left = ttk.Label(frame, text=lbl_left)
-        lbl_left.grid(row=grid_row, column=0, sticky="NSE")
-        ind_left = ttk.Label(frame, image=self.ind_off_img)
-        ind_left.grid(row=grid_row, column=1, sticky="")
-        ind_right = ttk.Label(frame, image=self.ind_off_img)
-        ind_right.grid(row=grid_row, column=2, sticky="")
+        ind_left, id_left = self.create_indicator(frame)
+        ind_right, id_right = self.create_indicator(frame)
         lbl_right = ttk.Label(frame, text=lbl_right)
-        lbl_right.grid(row=grid_row, column=3, sticky="NSW")
 
-        self.output_pin_indicators[grid_row] = (ind_left, ind_right)
+        # Grid all four widgets with a single Tcl script instead of four calls.
+        # Labels hug the indicators so pairs with different text widths line up
+        frame.tk.eval(
+            f"grid {lbl_left} -row {grid_row} -column 0 -sticky e\n"
+            f"grid {ind_left} {ind_right} -row {grid_row} -column 1\n"
+            f"grid {lbl_right} -row {grid_row} -column 3 -sticky w"
+        )
+
+        self.left_indicators.append((ind_left, id_left))
+        self.right_indicators.append((ind_right, id_right))
+        self.left_states.append(False)
+        self.right_states.append(False)
+
+    def create_indicator(self, frame: ttk.Frame) -> tuple[tk.Canvas, int]:
+        """
+        Create an output pin indicator in the off state
+
+        All indicators share the same on/off images, so an indicator is only a
+        canvas the size of the images holding one image item. Swapping the
+        image of a canvas item does not trigger a geometry recalculation
+
+        Returns:
+            tuple of (canvas, image item ID)
+        """
+        indicator = tk.Canvas(
+            frame,
+            width=self.ind_off_img.width(),
+            height=self.ind_off_img.height(),
+            background=self.ind_background,
+            highlightthickness=0,
+        )
+        image_id = indicator.create_image(0, 0, anchor="nw", image=self.ind_off_img)
+        return indicator, image_id
 
     def set_output_indicators(
         self, left_state: bool, right_state: bool, grid_row: int = 0
     ) -> None:
         """
         Set the output pin indicators for A (left) and B (right) pins
+
+        Indicators already showing the requested state are left untouched
         """
         # Set left ouput pin indicator
-        self.output_pin_indicators[grid_row][0].configure(
-            image=(self.ind_on_img if left_state else self.ind_off_img)
-        )
+        if left_state != self.left_states[grid_row]:
+            self.left_states[grid_row] = left_state
+            canvas, image_id = self.left_indicators[grid_row]
+            canvas.itemconfigure(image_id, image=self.ind_imgs[left_state])
 
         # Set right ouput pin indicator
-        self.output_pin_indicators[grid_row][1].configure(
-            image=(self.ind_on_img if right_state else self.ind_off_img)
-        )
+        if right_state != self.right_states[grid_row]:
+            self.right_states[grid_row] = right_state
+            canvas, image_id = self.right_indicators[grid_row]
+            canvas.itemconfigure(image_id, image=self.ind_imgs[right_state])
 
 
 class Serial_Connect_Panel(Interactive_Panel):
@@ -325,7 +508,7 @@ class Serial_Connect_Panel(Interactive_Panel):
     """Controls to connect to the serial port"""
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
         Initialize the serial connect panel
@@ -346,10 +529,8 @@ class Serial_Connect_Panel(Interactive_Panel):
             relief="groove",
             width=self.button_size[0],
             height=self.button_size[1],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
-            command=lambda: self.presenter.connect_to_serial_port(
-                self.com_port.get().upper()
-            ),
+            font=BUTTON_FONT_BOLD,
+            command=self.btn_connect_clicked,
         )
         self.btn_connect.grid(row=1, column=0, sticky="W")
 
@@ -364,7 +545,6 @@ class Serial_Connect_Panel(Interactive_Panel):
         self.ent_com_port = ttk.Entry(
             frame,
             width=14,
-            font=("TkDefaultFont", FONT_SIZE),
             justify="left",
             textvariable=self.com_port,
         )
@@ -405,12 +585,15 @@ class Serial_Connect_Panel(Interactive_Panel):
                 self.ent_com_port.configure(state="normal")
                 self.lbl_status.configure(text=status, foreground="red")
                 self.btn_connect.configure(
-                    text="Connect",
-                    command=lambda: self.presenter.connect_to_serial_port(
-                        self.com_port.get().upper()
-                    ),
+                    text="Connect", command=self.btn_connect_clicked
                 )
 
+    def btn_connect_clicked(self) -> None:
+        """
+        Connect to the serial port entered by the user
+        """
+        self.presenter.connect_to_serial_port(self.com_port.get().upper())
+
 
 class Mode_Selection_Panel(Interactive_Panel):
 
@@ -419,7 +602,7 @@ class Mode_Selection_Panel(Interactive_Panel):
     """
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
         Initialize the mode selection panel
@@ -434,27 +617,18 @@ class Mode_Selection_Panel(Interactive_Panel):
         lbl_mode = ttk.Label(frame, text="Mode:")
         lbl_mode.grid(row=0, column=0, sticky="NW")
 
-        self.valid_modes = [
-            "Automatic",
-            "Stop",
-            "Manual",
-            "Mute",
-        ]
         self.mode_selection = tk.StringVar(frame)
 
         self.opt_mode_dropdown = ttk.Combobox(
             frame,
             textvariable=self.mode_selection,
-            values=self.valid_modes,
+            values=VALID_MODES,
             state="readonly",
             width=self.button_size[0],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
+            font=BUTTON_FONT_BOLD,
         )
         self.opt_mode_dropdown.grid(row=1, column=0, sticky="W")
-        self.opt_mode_dropdown.bind(
-            "<<ComboboxSelected>>",
-            lambda _: self.presenter.set_mode(self.mode_selection.get()),
-        )
+        self.opt_mode_dropdown.bind("<<ComboboxSelected>>", self.opt_mode_selected)
 
         # Advanced bit toggling to set mode
         self.bit_toggling_enabled = tk.BooleanVar(frame)
@@ -474,53 +648,26 @@ class Mode_Selection_Panel(Interactive_Panel):
         bit_button_size = (10, 1)
         padx = pady = 4
 
-        self.btn_a1_mode_bit = tk.Button(
-            frame,
-            text="A1",
-            background="light grey",
-            relief="groove",
-            width=bit_button_size[0],
-            height=bit_button_size[1],
-            font=("TKDefaultFont", FONT_SIZE),
-            command=lambda: self.presenter.toggle_mode_bit("A1"),
-        )
-        self.btn_a1_mode_bit.grid(row=0, column=0, padx=padx, pady=pady)
-
-        self.btn_a2_mode_bit = tk.Button(
-            frame,
-            text="A2",
-            background="light grey",
-            relief="groove",
-            width=bit_button_size[0],
-            height=bit_button_size[1],
-            font=("TKDefaultFont", FONT_SIZE),
-            command=lambda: self.presenter.toggle_mode_bit("A2"),
-        )
-        self.btn_a2_mode_bit.grid(row=1, column=0, padx=padx, pady=pady)
-
-        self.btn_b1_mode_bit = tk.Button(
-            frame,
-            text="B1",
-            background="light grey",
-            relief="groove",
-            width=bit_button_size[0],
-            height=bit_button_size[1],
-            font=("TKDefaultFont", FONT_SIZE),
-            command=lambda: self.presenter.toggle_mode_bit("B1"),
-        )
-        self.btn_b1_mode_bit.grid(row=0, column=1, padx=padx, pady=pady)
-
-        self.btn_b2_mode_bit = tk.Button(
-            frame,
-            text="B2",
-            background="light grey",
-            relief="groove",
-            width=bit_button_size[0],
-            height=bit_button_size[1],
-            font=("TKDefaultFont", FONT_SIZE),
-            command=lambda: self.presenter.toggle_mode_bit("B2"),
-        )
-        self.btn_b2_mode_bit.grid(row=1, column=1, padx=padx, pady=pady)
+        # Bit buttons by bit ID, laid out with A bits on the left, B on the right
+        self.mode_bit_buttons = {}
+        for bit_id, row, column in (
+            ("A1", 0, 0),
+            ("A2", 1, 0),
+            ("B1", 0, 1),
+            ("B2", 1, 1),
+        ):
+            btn_mode_bit = tk.Button(
+                frame,
+                text=bit_id,
+                background="light grey",
+                relief="groove",
+                width=bit_button_size[0],
+                height=bit_button_size[1],
+                font=BUTTON_FONT,
+                command=partial(self.presenter.toggle_mode_bit, bit_id),
+            )
+            btn_mode_bit.grid(row=row, column=column, padx=padx, pady=pady)
+            self.mode_bit_buttons[bit_id] = btn_mode_bit
 
         # Set initial button states
         self.chk_mode_bit_toggled()
@@ -529,8 +676,14 @@ class Mode_Selection_Panel(Interactive_Panel):
         """
         Add the output pin pairs for the mode bits
         """
-        self.add_output_pin_pair(frame, "Mode A1", "Mode B1", 0)
-        self.add_output_pin_pair(frame, "Mode A2", "Mode B2", 1)
+        self.add_output_pin_pair(frame, "Mode A1", "Mode B1")
+        self.add_output_pin_pair(frame, "Mode A2", "Mode B2")
+
+    def opt_mode_selected(self, event: tk.Event) -> None:
+        """
+        Set the mode selected in the dropdown
+        """
+        self.presenter.set_mode(self.mode_selection.get())
 
     def chk_mode_bit_toggled(self) -> None:
         """
@@ -538,273 +691,188 @@ class Mode_Selection_Panel(Interactive_Panel):
         """
         if self.bit_toggling_enabled.get():
             self.opt_mode_dropdown["state"] = tk.DISABLED
-            self.btn_a1_mode_bit["state"] = tk.NORMAL
-            self.btn_a2_mode_bit["state"] = tk.NORMAL
-            self.btn_b1_mode_bit["state"] = tk.NORMAL
-            self.btn_b2_mode_bit["state"] = tk.NORMAL
+            bit_button_state = tk.NORMAL
         else:
             self.opt_mode_dropdown["state"] = "readonly"
-            self.btn_a1_mode_bit["state"] = tk.DISABLED
-            self.btn_a2_mode_bit["state"] = tk.DISABLED
-            self.btn_b1_mode_bit["state"] = tk.DISABLED
-            self.btn_b2_mode_bit["state"] = tk.DISABLED
+            bit_button_state = tk.DISABLED
+
+        for btn_mode_bit in self.mode_bit_buttons.values():
+            btn_mode_bit["state"] = bit_button_state
 
 
-class Emergency_Stop_Panel(Interactive_Panel):
+class Dual_Channel_Trigger_Panel(Interactive_Panel):
 
     """
-    Controls to toggle the emergency stop state
+    Controls to toggle a dual channel (A/B) safety input
+
+    The e-stop and interlock panels differ only in their text, button color,
+    output pins and presenter method, which are passed to the constructor.
     """
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self,
+        parent: ttk.Frame,
+        presenter: Presenter,
+        grid_row: list[int],
+        label: str,
+        button_text: str,
+        button_color: str,
+        pin_labels: tuple[tuple[str, str], ...],
+        toggle_trigger: callable,
     ) -> None:
         """
-        Initialize the emergency stop panel
+        Initialize the dual channel trigger panel
+
+        label: text of the label above the toggle button
+        button_text: text of the toggle button
+        button_color: background color of the toggle button
+        pin_labels: (A label, B label) of each output pin pair
+        toggle_trigger: presenter method that toggles the input
         """
+        self.label = label
+        self.button_text = button_text
+        self.button_color = button_color
+        self.pin_labels = pin_labels
+        self.delay_vcmd = parent.delay_vcmd
+
+        # Bind the presenter method once instead of looking it up on every click
+        self.toggle_trigger = toggle_trigger
+
         super().__init__(parent, presenter, grid_row)
 
     def create_left_widgets(self, frame: ttk.Frame) -> None:
         """
-        Create the label and toggle e-stop button
+        Create the label and toggle button
         """
-        lbl_e_stop = ttk.Label(frame, text="Emergency Stop:")
-        lbl_e_stop.grid(row=0, column=0, sticky="NW")
+        lbl_trigger = ttk.Label(frame, text=self.label)
+        lbl_trigger.grid(row=0, column=0, sticky="NW")
 
-        btn_e_stop = tk.Button(
+        btn_trigger = tk.Button(
             frame,
-            text="Toggle E-Stop",
-            background="red",
+            text=self.button_text,
+            background=self.button_color,
             relief="groove",
             width=self.button_size[0],
             height=self.button_size[1],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
-            command=lambda: self.presenter.toggle_e_stop(
-                [  # Get the trigger state key from the value in the dict
-                    trig_state_key
-                    for trig_state_key, trig_state_val in self.trigger_states.items()
-                    if trig_state_val == self.e_stop_trigger_selection.get()
-                ][0],
-                self.e_stop_delay_ms.get(),
-            ),
+            font=BUTTON_FONT_BOLD,
+            command=self.btn_trigger_clicked,
         )
-        btn_e_stop.grid(row=1, column=0, sticky="W")
+        btn_trigger.grid(row=1, column=0, sticky="W")
 
     def create_center_widgets(self, frame: ttk.Frame) -> None:
         """
-        Create the dropdown selection and delay entry widgets for the e-stop panel
-        """
-        # E-Stop dual channel trigger selection
-        self.trigger_states = {
-            "A and B": "Toggle A and B together",
-            "A then B": "Toggle A then B, [Delay] ms",
-            "B then A": "Toggle B then A, [Delay] ms",
-            "A only": "Toggle A only",
-            "B only": "Toggle B only",
-        }
-        self.e_stop_trigger_selection = tk.StringVar(frame)
-        self.e_stop_trigger_selection.set(self.trigger_states["A and B"])
-        opt_e_stop_dropdown = ttk.Combobox(
+        Create the dropdown selection and delay entry widgets
+        """
+        self.trigger_selection = tk.StringVar(frame)
+        self.trigger_selection.set(TRIGGER_STATES["A and B"])
+        opt_trigger_dropdown = ttk.Combobox(
             frame,
-            textvariable=self.e_stop_trigger_selection,
-            values=[*self.trigger_states.values()],
+            textvariable=self.trigger_selection,
+            values=TRIGGER_STATE_TEXTS,
             state="readonly",
             width=23,
         )
-        opt_e_stop_dropdown.bind("<<ComboboxSelected>>", self.toggle_delay_entry_state)
-        opt_e_stop_dropdown.grid(row=0, column=0, columnspan=3)
+        opt_trigger_dropdown.bind("<<ComboboxSelected>>", self.toggle_delay_entry_state)
+        opt_trigger_dropdown.grid(row=0, column=0, columnspan=3)
 
-        # E-Stop triggering delay entry
-        self.e_stop_delay_ms = tk.StringVar(frame, "")
+        # Triggering delay entry
+        self.delay_ms = tk.StringVar(frame, "")
 
         ttk.Label(frame, text="Delay: ").grid(row=1, column=0, sticky="E")
 
-        vcmd = (frame.register(self.validate_delay_entry), "%P")
-        self.ent_e_stop_delay = ttk.Entry(
+        self.ent_delay = ttk.Entry(
             frame,
             width=2,
-            font=("TkDefaultFont", FONT_SIZE),
             justify="right",
-            textvariable=self.e_stop_delay_ms,
+            textvariable=self.delay_ms,
             state=tk.DISABLED,
             validate="key",
-            validatecommand=vcmd,
+            validatecommand=self.delay_vcmd,
         )
-        self.ent_e_stop_delay.grid(row=1, column=1, sticky="EW")
+        self.ent_delay.grid(row=1, column=1, sticky="EW")
 
         ttk.Label(frame, text="ms").grid(row=1, column=2, sticky="W")
 
     def create_right_widgets(self, frame: ttk.Frame) -> None:
         """
-        Add the output pin pairs for the E-Stop and Stop buttons
+        Add the output pin pairs
+        """
+        for lbl_left, lbl_right in self.pin_labels:
+            self.add_output_pin_pair(frame, lbl_left, lbl_right)
+
+    def btn_trigger_clicked(self) -> None:
+        """
+        Toggle the input using the selected trigger state and delay
         """
-        self.add_output_pin_pair(frame, "E-Stop A", "E-Stop B", 0)
-        self.add_output_pin_pair(frame, "Stop A", "Stop B", 1)
+        trigger_state = TRIGGER_STATE_KEYS[self.trigger_selection.get()]
+        self.toggle_trigger(trigger_state, self.delay_ms.get())
 
     def toggle_delay_entry_state(self, event: tk.Event) -> None:
         """
         Enable or disable the delay entry based on the trigger selection
         """
-        if (
-            self.e_stop_trigger_selection.get() == self.trigger_states["A then B"]
-            or self.e_stop_trigger_selection.get() == self.trigger_states["B then A"]
-        ):
+        if self.trigger_selection.get() in DELAY_TRIGGER_STATES:
             # Enable delay entry
-            self.ent_e_stop_delay["state"] = tk.NORMAL
+            self.ent_delay["state"] = tk.NORMAL
 
             # Set initial value to 0, select text with cursor at the end, and focus
-            self.e_stop_delay_ms.set("0")
-            self.ent_e_stop_delay.selection_range(0, tk.END)
-            self.ent_e_stop_delay.icursor("end")
-            self.ent_e_stop_delay.focus_set()
+            self.delay_ms.set("0")
+            self.ent_delay.selection_range(0, tk.END)
+            self.ent_delay.icursor("end")
+            self.ent_delay.focus_set()
 
         else:
             # Disable delay entry and clear value
-            self.ent_e_stop_delay["state"] = tk.DISABLED
-            self.e_stop_delay_ms.set("")
+            self.ent_delay["state"] = tk.DISABLED
+            self.delay_ms.set("")
 
-    def validate_delay_entry(self, value: str) -> None:
-        """
-        Validate the delay entry value is an integer between 0 and 99999
-        """
-        if value:
-            try:
-                val = int(value)
-                if val < 0 or val > 99999:
-                    return False
-                return True
-            except ValueError:
-                return False
-        return True
 
-
-class Interlock_Panel(Interactive_Panel):
+class Emergency_Stop_Panel(Dual_Channel_Trigger_Panel):
 
     """
-    Controls to toggle the interlock state
+    Controls to toggle the emergency stop state
     """
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
-        Initialize the interlock panel
-        """
-        super().__init__(parent, presenter, grid_row)
-
-    def create_left_widgets(self, frame: ttk.Frame) -> None:
-        """
-        Create the label and toggle interlock button
+        Initialize the emergency stop panel
         """
-        lbl_interlock = ttk.Label(frame, text="Interlock:")
-        lbl_interlock.grid(row=0, column=0, sticky="NW")
-
-        btn_interlock = tk.Button(
-            frame,
-            text="Toggle Interlock",
-            background="yellow",
-            relief="groove",
-            width=self.button_size[0],
-            height=self.button_size[1],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
-            command=lambda: self.presenter.toggle_interlock(
-                [  # Get the trigger state key from the value in the dict
-                    trig_state_key
-                    for trig_state_key, trig_state_val in self.trigger_states.items()
-                    if trig_state_val == self.interlock_trigger_selection.get()
-                ][0],
-                self.interlock_delay_ms.get(),
-            ),
+        super().__init__(
+            parent,
+            presenter,
+            grid_row,
+            label="Emergency Stop:",
+            button_text="Toggle E-Stop",
+            button_color="red",
+            pin_labels=(("E-Stop A", "E-Stop B"), ("Stop A", "Stop B")),
+            toggle_trigger=presenter.toggle_e_stop,
         )
-        btn_interlock.grid(row=1, column=0, sticky="W")
 
-    def create_center_widgets(self, frame: ttk.Frame) -> None:
-        """
-        Create the dropdown selection and delay entry widgets for the interlock panel
-        """
-        # Interlock dual channel trigger selection
-        self.trigger_states = {
-            "A and B": "Toggle A and B together",
-            "A then B": "Toggle A then B, [Delay] ms",
-            "B then A": "Toggle B then A, [Delay] ms",
-            "A only": "Toggle A only",
-            "B only": "Toggle B only",
-        }
-        self.interlock_trigger_selection = tk.StringVar(frame)
-        self.interlock_trigger_selection.set(self.trigger_states["A and B"])
-        opt_interlock_dropdown = ttk.Combobox(
-            frame,
-            textvariable=self.interlock_trigger_selection,
-            values=[*self.trigger_states.values()],
-            state="readonly",
-            width=23,
-        )
-        opt_interlock_dropdown.bind(
-            "<<ComboboxSelected>>", self.toggle_delay_entry_state
-        )
-        opt_interlock_dropdown.grid(row=0, column=0, columnspan=3)
-
-        # Interlock triggering delay entry
-        self.interlock_delay_ms = tk.StringVar(frame, "")
-
-        ttk.Label(frame, text="Delay: ").grid(row=1, column=0, sticky="E")
-
-        vcmd = (frame.register(self.validate_delay_entry), "%P")
-        self.ent_interlock_delay = ttk.Entry(
-            frame,
-            width=2,
-            justify="right",
-            font=("TkDefaultFont", FONT_SIZE),
-            textvariable=self.interlock_delay_ms,
-            state=tk.DISABLED,
-            validate="key",
-            validatecommand=vcmd,
-        )
-        self.ent_interlock_delay.grid(row=1, column=1, sticky="EW")
-
-        ttk.Label(frame, text="ms").grid(row=1, column=2, sticky="W")
-
-    def create_right_widgets(self, frame: ttk.Frame) -> None:
-        """
-        Add output pin pair for controller interlock
-        """
-        self.add_output_pin_pair(frame, "Interlock A", "Interlock B")
 
-    def toggle_delay_entry_state(self, event: tk.Event) -> None:
-        """
-        Enable or disable the delay entry based on the interlock trigger selection
-        """
-        if (
-            self.interlock_trigger_selection.get() == self.trigger_states["A then B"]
-            or self.interlock_trigger_selection.get() == self.trigger_states["B then A"]
-        ):
-            # Enable delay entry
-            self.ent_interlock_delay["state"] = tk.NORMAL
+class Interlock_Panel(Dual_Channel_Trigger_Panel):
 
-            # Set initial value to 0, select text with cursor at the end, and focus
-            self.interlock_delay_ms.set("0")
-            self.ent_interlock_delay.selection_range(0, tk.END)
-            self.ent_interlock_delay.icursor("end")
-            self.ent_interlock_delay.focus_set()
-
-        else:
-            # Disable delay entry and clear value
-            self.ent_interlock_delay["state"] = tk.DISABLED
-            self.interlock_delay_ms.set("")
+    """
+    Controls to toggle the interlock state
+    """
 
-    def validate_delay_entry(self, value: str) -> None:
+    def __init__(
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
+    ) -> None:
         """
-        Validate delay entry value is an integer between 0 and 99999
+        Initialize the interlock panel
         """
-        if value:
-            try:
-                val = int(value)
-                if val < 0 or val > 99999:
-                    return False
-                return True
-            except ValueError:
-                return False
-        return True
+        super().__init__(
+            parent,
+            presenter,
+            grid_row,
+            label="Interlock:",
+            button_text="Toggle Interlock",
+            button_color="yellow",
+            pin_labels=(("Interlock A", "Interlock B"),),
+            toggle_trigger=presenter.toggle_interlock,
+        )
 
 
 class Power_Panel(Interactive_Panel):
@@ -814,7 +882,7 @@ class Power_Panel(Interactive_Panel):
     """
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
         Initialize the power panel
@@ -835,7 +903,7 @@ class Power_Panel(Interactive_Panel):
             relief="groove",
             width=self.button_size[0],
             height=self.button_size[1],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
+            font=BUTTON_FONT_BOLD,
             command=self.presenter.toggle_power,
         )
         btn_power.grid(row=1, column=0, sticky="W")
@@ -861,7 +929,7 @@ class Heartbeat_Panel(Interactive_Panel):
     """
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
         Initialize the heartbeat panel
@@ -882,7 +950,7 @@ class Heartbeat_Panel(Interactive_Panel):
             relief="groove",
             width=self.button_size[0],
             height=self.button_size[1],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
+            font=BUTTON_FONT_BOLD,
             command=self.presenter.measure_heartbeat,
         )
         self.btn_measure_hearbeat.grid(row=1, column=0, sticky="W")
@@ -925,7 +993,7 @@ class Echo_String_Panel(Interactive_Panel):
     """
 
     def __init__(
-        self, parent: ttk.Frame, presenter: Presenter, grid_row: tk.IntVar
+        self, parent: ttk.Frame, presenter: Presenter, grid_row: list[int]
     ) -> None:
         """
         Initialize the echo string panel
@@ -946,8 +1014,8 @@ class Echo_String_Panel(Interactive_Panel):
             relief="groove",
             width=self.button_size[0],
             height=self.button_size[1],
-            font=("TKDefaultFont", FONT_SIZE, "bold"),
-            command=lambda: self.presenter.echo_string(self.message.get()),
+            font=BUTTON_FONT_BOLD,
+            command=self.btn_echo_string_clicked,
         )
         self.btn_echo_string.grid(row=1, column=0, sticky="W")
 
@@ -959,7 +1027,6 @@ class Echo_String_Panel(Interactive_Panel):
         self.ent_echo_string = ttk.Entry(
             frame,
             width=25,
-            font=("TkDefaultFont", FONT_SIZE),
             justify="left",
             textvariable=self.message,
         )
@@ -971,6 +1038,12 @@ class Echo_String_Panel(Interactive_Panel):
         """
         self.add_output_pin_pair(frame, "Teach Mode A", "Teach Mode B")
 
+    def btn_echo_string_clicked(self) -> None:
+        """
+        Send the entered message to the controller's LCD
+        """
+        self.presenter.echo_string(self.message.get())
+
 
 class Logging_Frame(ttk.Frame):
 
@@ -1019,7 +1092,6 @@ class Logging_Frame(ttk.Frame):
             relief="groove",
             width=self.button_size[0],
             height=self.button_size[1],
-            font=("TkDefaultFont", FONT_SIZE),
             command=self.toggle_logging_to_file,
         )
         self.btn_toggle_logging.grid(row=0, column=1, pady=5, sticky="SE")
@@ -1031,7 +1103,6 @@ class Logging_Frame(ttk.Frame):
             height=self.text_box_size[1],
             relief="groove",
             borderwidth=2,
-            font=("TkDefaultFont", FONT_SIZE),
         )
         self.txt_logging.grid(row=1, column=0, columnspan=2, sticky="EW", pady=10)
         self.txt_logging.configure(state=tk.DISABLED)